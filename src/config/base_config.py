@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2026 Matteo Colazilli
+
+import os
+from typing import Self
+
+from dotenv import dotenv_values
+from pydantic import BaseModel, ConfigDict
+
+_ENV_FILE = ".env"
+
+
+def _read_env() -> dict[str, str]:
+    """Return the .env file merged under the process environment.
+
+    Keys are lower-cased so that variable names match case-insensitively, and
+    variables already set in the environment take precedence over the file.
+    The file is read on every call and never exported into `os.environ`.
+    """
+    values = {
+        key.lower(): value
+        for key, value in dotenv_values(_ENV_FILE, encoding="utf-8").items()
+        if value is not None
+    }
+    values.update((key.lower(), value) for key, value in os.environ.items())
+    return values
+
+
+class EnvConfig(BaseModel):
+    """Base class for settings read from environment variables or a .env file.
+
+    Fields are looked up by name, case-insensitively, in the process
+    environment and the .env file, then validated by Pydantic as usual.
+    """
+
+    model_config = ConfigDict(
+        extra="ignore",  # Ignore extra fields from the environment
+    )
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Build and validate an instance from the environment and .env file."""
+        env = _read_env()
+        return cls.model_validate(
+            {
+                name: env[name.lower()]
+                for name in cls.model_fields
+                if name.lower() in env
+            }
+        )
@@ -1,20 +1,20 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2026 Matteo Colazilli
 
+from functools import cached_property, lru_cache
+from typing import Final
+
 from pydantic import Field, SecretStr, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.config.base_config import EnvConfig
 
-class GvmClientConfig(BaseSettings):
-    """Application configuration (GVM/GMP credentials)."""
+_DEFAULT_USERNAME: Final[str] = "admin"
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
 
-    USERNAME: str = "admin"
+class GvmClientConfig(EnvConfig):
+    """Application configuration (GVM/GMP credentials)."""
+
+    USERNAME: str = _DEFAULT_USERNAME
     PASSWORD: SecretStr = Field(..., description="Required Greenbone Password.")
 
     @field_validator("PASSWORD")
@@ -23,3 +23,21 @@ class GvmClientConfig(BaseSettings):
         if not v.get_secret_value().strip():
             raise ValueError("PASSWORD must not be empty")
         return v
+
+    @cached_property
+    def password_plain(self) -> str:
+        """Plain-text password, unwrapped from `SecretStr` once per instance."""
+        return self.PASSWORD.get_secret_value()
+
+
+@lru_cache(maxsize=1)
+def get_gvm_client_config() -> GvmClientConfig:
+    """Return the process-wide GVM client configuration.
+
+    The settings are loaded from the environment (and `.env`) on the first
+    call only; use `get_gvm_client_config.cache_clear()` to force a reload.
+    Validation errors are not cached, but a config that loads and is then
+    rejected by gvmd is: callers must clear the cache when building or
+    authenticating the client with it fails.
+    """
+    return GvmClientConfig.from_env()
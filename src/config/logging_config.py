@@ -3,46 +3,69 @@
 
 import logging
 import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from src.config.base_config import EnvConfig
 
+_DEFAULT_LOG_LEVEL: Final[str] = "INFO"
 _DEFAULT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 _DEFAULT_DATEFMT = "%d-%m-%Y %H:%M:%S"
+_FORMATTER = logging.Formatter(_DEFAULT_FORMAT, _DEFAULT_DATEFMT)
 
+_configured = False
 
-class LoggingConfig(BaseSettings):
+# Level names are fixed after import; snapshot them instead of rebuilding the
+# mapping on every lookup.
+_LEVEL_MAP = MappingProxyType(logging.getLevelNamesMapping())
+
+
+class LoggingConfig(EnvConfig):
     """Defines the logging configuration using Pydantic.
 
     It automatically reads from environment variables or a .env file.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",  # Ignore extra fields from the environment
-    )
-
     # Configuration fields with types and default values
-    LOG_LEVEL: str = "INFO"
+    LOG_LEVEL: str = _DEFAULT_LOG_LEVEL
+
+
+@lru_cache(maxsize=1)
+def get_logging_config() -> LoggingConfig:
+    """Return the process-wide logging configuration, loaded once."""
+    return LoggingConfig.from_env()
+
 
 def _resolve_log_level(level: str | int) -> int:
     if isinstance(level, int):
         return level
-    return logging.getLevelNamesMapping().get(level.upper(), logging.INFO)
+    return _LEVEL_MAP.get(level.upper(), logging.INFO)
 
 
 def setup_logging(
     level: str | int | None = None,
 ) -> None:
-    """Configure root logging for stderr output."""
+    """Configure root logging for stderr output.
+
+    Repeated calls without an explicit `level` are no-ops, so the root logger
+    is configured once instead of being torn down and rebuilt on every call.
+    """
+    global _configured
+    if _configured and level is None:
+        return
 
-    logging_config = LoggingConfig()
+    logging_config = get_logging_config()
     resolved_level = _resolve_log_level(level or logging_config.LOG_LEVEL)
 
-    logging.basicConfig(
-        level=resolved_level,
-        format=_DEFAULT_FORMAT,
-        datefmt=_DEFAULT_DATEFMT,
-        handlers=[logging.StreamHandler(stream=sys.stderr)],
-        force=True,
-    )
+    handler = logging.StreamHandler(stream=sys.stderr)
+    handler.setFormatter(_FORMATTER)
+
+    root_logger = logging.getLogger()
+    for old_handler in root_logger.handlers[:]:
+        root_logger.removeHandler(old_handler)
+        old_handler.close()
+    root_logger.addHandler(handler)
+    root_logger.setLevel(resolved_level)
+
+    _configured = True
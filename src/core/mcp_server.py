@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Optional
 
@@ -7,46 +8,88 @@ from mcp import McpError
 from mcp.types import ErrorData, INTERNAL_ERROR
 from pydantic import ValidationError
 
-from src.config.gvm_client_config import GvmClientConfig
+from src.config.gvm_client_config import get_gvm_client_config
 from src.services.gvm_client import GvmClient
-from src.tools.inspection_control_tools import register_inspection_control_tools
-from src.tools.vm_workflow_tools import register_vm_workflow_tools
 
 from gvm.errors import GvmResponseError
 
 logger = logging.getLogger(__name__)
 
 
+# gvmd reports rejected credentials via the response's status_text.
+_AUTH_FAILED_STATUS_TEXT = "Authentication failed"
+
+_GVM_CONFIG_ERROR_MESSAGES = {
+    ("PASSWORD", "missing"): (
+        "Failed to load GVM configuration: PASSWORD is required "
+        "(set it in .env or environment variables)."
+    ),
+}
+
+
 def _format_gvm_config_error(ex: ValidationError) -> str:
     for err in ex.errors():
         loc = ".".join(str(x) for x in err.get("loc", []))
-        err_type = err.get("type", "")
-        msg = err.get("msg", "invalid value")
+        if loc != "PASSWORD":
+            continue
+
+        message = _GVM_CONFIG_ERROR_MESSAGES.get((loc, err.get("type", "")))
+        if message is not None:
+            return message
 
-        if loc == "PASSWORD" and err_type == "missing":
-            return "Failed to load GVM configuration: PASSWORD is required (set it in .env or environment variables)."
-        if loc == "PASSWORD":
-            return f"Failed to load GVM configuration: PASSWORD {msg}."
+        msg = err.get("msg", "invalid value")
+        return f"Failed to load GVM configuration: PASSWORD {msg}."
 
     return "Failed to load GVM configuration: invalid settings."
 
 
+_shared_gvm_client: Optional[GvmClient] = None
+
+
+def _get_gvm_client() -> GvmClient:
+    """Return the process-wide GvmClient, building and authenticating it once.
+
+    A client is only cached after a successful authentication. A failed
+    attempt also drops the cached settings, and `.env` is re-read on every
+    load, so the next initialization starts again from the current
+    environment and `.env` file.
+    """
+    global _shared_gvm_client
+    if _shared_gvm_client is None:
+        gvm_client_config = get_gvm_client_config()
+
+        try:
+            gvm_client = GvmClient(
+                username=gvm_client_config.USERNAME,
+                password=gvm_client_config.password_plain,
+            )
+            gvm_client.authenticate()
+        except Exception:
+            # Reload the settings on the next initialization instead of
+            # reusing credentials that failed here.
+            get_gvm_client_config.cache_clear()
+            raise
+
+        _shared_gvm_client = gvm_client
+    return _shared_gvm_client
+
+
 class GreenboneInitMiddleware(Middleware):
     def __init__(self, server: "GreenboneMCP"):
         self.server = server
+        self._initialized = False
 
     async def on_initialize(self, context: MiddlewareContext, call_next):
 
-        try:
-            gvm_client_config = GvmClientConfig()
-
-            self.server._gvm_client = GvmClient(
-                username=gvm_client_config.USERNAME,
-                password=gvm_client_config.PASSWORD.get_secret_value(),
-            )
-            
-            self.server._gvm_client.authenticate()
+        # The backend and tools only need to be set up once per server; later
+        # initialize requests go straight through.
+        if self._initialized:
+            return await call_next(context)
 
+        try:
+            # Connecting and authenticating is blocking socket I/O; keep it off
+            # the event loop.
+            self.server._gvm_client = await asyncio.to_thread(_get_gvm_client)
         except ValidationError as ex:
             self.server._gvm_client = None
             msg = _format_gvm_config_error(ex)
@@ -54,19 +97,28 @@ class GreenboneInitMiddleware(Middleware):
             raise McpError(ErrorData(code=INTERNAL_ERROR, message=msg))
         except GvmResponseError as ex:
             self.server._gvm_client = None
-            if "Authentication failed" in str(ex):
+            if ex.message and _AUTH_FAILED_STATUS_TEXT in ex.message:
                 raise McpError(ErrorData(code=INTERNAL_ERROR, message="Failed to authenticate with GVM: wrong credentials."))
             raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to authenticate with GVM: {ex}"))
         except Exception as ex:
             self.server._gvm_client = None  
-            logger.exception("Failed to initialize Greenbone backend: %s", ex)
+            logger.error("Failed to initialize Greenbone backend: %s", ex, exc_info=True)
             raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to initialize Greenbone backend: {ex}"))
 
+        # Tool modules are only needed once the backend is up; importing them
+        # here keeps them off the server start-up path.
+        from src.tools.inspection_control_tools import (
+            register_inspection_control_tools,
+        )
+        from src.tools.vm_workflow_tools import register_vm_workflow_tools
+
         register_inspection_control_tools(self.server, self.server._gvm_client)
         register_vm_workflow_tools(self.server, self.server._gvm_client)
 
+        self._initialized = True
+
         logger.info("Greenbone backend initialized successfully.")
-        await call_next(context)
+        return await call_next(context)
 
 
 class GreenboneMCP(FastMCP):
@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2026 Matteo Colazilli
+
+"""Shared, read-only xsdata field metadata used by the generated models.
+
+Most generated fields carry one of a handful of identical metadata
+mappings; referencing these constants avoids allocating a separate dict
+for every field definition.
+"""
+
+from types import MappingProxyType
+
+ELEMENT = MappingProxyType({"type": "Element"})
+ELEMENT_REQUIRED = MappingProxyType({"type": "Element", "required": True})
+ELEMENT_MIN_OCCURS_1 = MappingProxyType({"type": "Element", "min_occurs": 1})
+ATTRIBUTE = MappingProxyType({"type": "Attribute"})
+ATTRIBUTE_REQUIRED = MappingProxyType({"type": "Attribute", "required": True})
+REQUIRED = MappingProxyType({"required": True})
+
+# `type` elements are bound to `type_value` fields (safe-prefixed by xsdata).
+TYPE_ELEMENT = MappingProxyType({"name": "type", "type": "Element"})
+TYPE_ELEMENT_REQUIRED = MappingProxyType(
+    {"name": "type", "type": "Element", "required": True}
+)
@@ -77,6 +77,7 @@ from src.models.generated.scanner_count import ScannerCount
 from src.models.generated.scanners import Scanners
 from src.models.generated.schedule import Schedule
 from src.models.generated.severity import Severity
+from src.models.generated.severity_count import SeverityCount
 from src.models.generated.smb_credential import SmbCredential
 from src.models.generated.snmp_credential import SnmpCredential
 from src.models.generated.sort import Sort
@@ -169,6 +170,7 @@ __all__ = [
     "Scanners",
     "Schedule",
     "Severity",
+    "SeverityCount",
     "SmbCredential",
     "SnmpCredential",
     "Sort",
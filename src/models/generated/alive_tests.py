@@ -1,14 +1,29 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import ForwardRef
 
+from src.models.field_metadata import REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class AliveTests:
     class Meta:
         name = "alive_tests"
 
+    @dataclass(kw_only=True, slots=True)
+    class AliveTest:
+        value: str = field(
+            default="",
+            metadata=REQUIRED,
+        )
+
+    @dataclass(kw_only=True, slots=True)
+    class Value:
+        value: str = field(
+            default="",
+            metadata=REQUIRED,
+        )
+
     content: list[object] = field(
         default_factory=list,
         metadata={
@@ -18,29 +33,11 @@ class AliveTests:
             "choices": (
                 {
                     "name": "alive_test",
-                    "type": ForwardRef("AliveTests.AliveTest"),
+                    "type": AliveTest,
                 },
                 {
-                    "type": ForwardRef("AliveTests.Value"),
+                    "type": Value,
                 },
             ),
         },
     )
-
-    @dataclass(kw_only=True)
-    class AliveTest:
-        value: str = field(
-            default="",
-            metadata={
-                "required": True,
-            },
-        )
-
-    @dataclass(kw_only=True)
-    class Value:
-        value: str = field(
-            default="",
-            metadata={
-                "required": True,
-            },
-        )
@@ -1,56 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import ForwardRef
 
+from src.models.field_metadata import ELEMENT
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class AssetCount:
     class Meta:
         name = "asset_count"
 
-    content: list[object] = field(
-        default_factory=list,
-        metadata={
-            "type": "Wildcard",
-            "namespace": "##any",
-            "mixed": True,
-            "choices": (
-                {
-                    "name": "filtered",
-                    "type": ForwardRef("AssetCount.Filtered"),
-                },
-                {
-                    "name": "page",
-                    "type": ForwardRef("AssetCount.Page"),
-                },
-                {
-                    "type": ForwardRef("AssetCount.Value"),
-                },
-            ),
-        },
+    filtered: None | int = field(
+        default=None,
+        metadata=ELEMENT,
     )
-
-    @dataclass(kw_only=True)
-    class Filtered:
-        value: int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Page:
-        value: int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Value:
-        value: int = field(
-            metadata={
-                "required": True,
-            }
-        )
+    page: None | int = field(
+        default=None,
+        metadata=ELEMENT,
+    )
+    value: None | int = field(default=None)
@@ -2,33 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ATTRIBUTE_REQUIRED, ELEMENT
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class AuthenticateResponse:
     class Meta:
         name = "authenticate_response"
 
-    status: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    status_text: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    status: int = field(metadata=ATTRIBUTE_REQUIRED)
+    status_text: str = field(metadata=ATTRIBUTE_REQUIRED)
     role: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     timezone: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
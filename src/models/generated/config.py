@@ -4,105 +4,74 @@ from dataclasses import dataclass, field
 
 from xsdata.models.datatype import XmlDateTime
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT,
+    ELEMENT_REQUIRED,
+    TYPE_ELEMENT,
+)
 from src.models.generated.family_count import FamilyCount
 from src.models.generated.nvt_count import NvtCount
 from src.models.generated.owner import Owner
 from src.models.generated.permissions import Permissions
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Config:
     class Meta:
         name = "config"
 
-    id: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    id: str = field(metadata=ATTRIBUTE_REQUIRED)
     owner: None | Owner = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
-    )
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT,
     )
+    name: str = field(metadata=ELEMENT_REQUIRED)
     comment: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     creation_time: None | XmlDateTime = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     modification_time: None | XmlDateTime = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     writable: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     in_use: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     permissions: None | Permissions = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     family_count: None | FamilyCount = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     nvt_count: None | NvtCount = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     type_value: None | int = field(
         default=None,
-        metadata={
-            "name": "type",
-            "type": "Element",
-        },
+        metadata=TYPE_ELEMENT,
     )
     usage_type: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     predefined: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     trash: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
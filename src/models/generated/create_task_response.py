@@ -2,27 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ATTRIBUTE_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class CreateTaskResponse:
     class Meta:
         name = "create_task_response"
 
-    status: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    status_text: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    id: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    status: int = field(metadata=ATTRIBUTE_REQUIRED)
+    status_text: str = field(metadata=ATTRIBUTE_REQUIRED)
+    id: str = field(metadata=ATTRIBUTE_REQUIRED)
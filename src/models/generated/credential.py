@@ -2,34 +2,26 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT,
+    ELEMENT_REQUIRED,
+    TYPE_ELEMENT,
+)
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Credential:
     class Meta:
         name = "credential"
 
-    id: object = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    name: None | object = field(
+    id: str = field(metadata=ATTRIBUTE_REQUIRED)
+    name: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
-    type_value: None | object = field(
+    type_value: None | str = field(
         default=None,
-        metadata={
-            "name": "type",
-            "type": "Element",
-        },
-    )
-    trash: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=TYPE_ELEMENT,
     )
+    trash: int = field(metadata=ELEMENT_REQUIRED)
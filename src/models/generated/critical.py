@@ -1,22 +1,8 @@
-from __future__ import annotations
+from src.models.generated.severity_count import SeverityCount
 
-from dataclasses import dataclass, field
 
+class Critical(SeverityCount):
+    __slots__ = ()
 
-@dataclass(kw_only=True)
-class Critical:
     class Meta:
         name = "critical"
-
-    full: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    filtered: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
@@ -2,21 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Daemon:
     class Meta:
         name = "daemon"
 
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    version: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    name: str = field(metadata=ELEMENT_REQUIRED)
+    version: str = field(metadata=ELEMENT_REQUIRED)
@@ -2,29 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_REQUIRED
 from src.models.generated.source import Source
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Detail:
     class Meta:
         name = "detail"
 
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    value: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    source: Source = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    name: str = field(metadata=ELEMENT_REQUIRED)
+    value: str = field(metadata=ELEMENT_REQUIRED)
+    source: Source = field(metadata=ELEMENT_REQUIRED)
@@ -4,48 +4,19 @@ from dataclasses import dataclass, field
 
 from xsdata.models.datatype import XmlDateTime
 
+from src.models.field_metadata import ELEMENT_REQUIRED
 from src.models.generated.host import Host
 from src.models.generated.nvt import Nvt
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Error:
     class Meta:
         name = "error"
 
-    host: Host = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    port: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    description: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    nvt: Nvt = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    scan_nvt_version: XmlDateTime = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    severity: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    host: Host = field(metadata=ELEMENT_REQUIRED)
+    port: str = field(metadata=ELEMENT_REQUIRED)
+    description: str = field(metadata=ELEMENT_REQUIRED)
+    nvt: Nvt = field(metadata=ELEMENT_REQUIRED)
+    scan_nvt_version: XmlDateTime = field(metadata=ELEMENT_REQUIRED)
+    severity: int = field(metadata=ELEMENT_REQUIRED)
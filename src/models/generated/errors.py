@@ -2,24 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_MIN_OCCURS_1, ELEMENT_REQUIRED
 from src.models.generated.error import Error
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Errors:
     class Meta:
         name = "errors"
 
-    count: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    count: int = field(metadata=ELEMENT_REQUIRED)
     error: list[Error] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-            "min_occurs": 1,
-        },
+        metadata=ELEMENT_MIN_OCCURS_1,
     )
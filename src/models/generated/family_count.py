@@ -1,44 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import ForwardRef
 
+from src.models.field_metadata import ELEMENT
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class FamilyCount:
     class Meta:
         name = "family_count"
 
-    content: list[object] = field(
-        default_factory=list,
-        metadata={
-            "type": "Wildcard",
-            "namespace": "##any",
-            "mixed": True,
-            "choices": (
-                {
-                    "name": "growing",
-                    "type": ForwardRef("FamilyCount.Growing"),
-                },
-                {
-                    "type": ForwardRef("FamilyCount.Value"),
-                },
-            ),
-        },
+    growing: None | int = field(
+        default=None,
+        metadata=ELEMENT,
     )
-
-    @dataclass(kw_only=True)
-    class Growing:
-        value: int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Value:
-        value: int = field(
-            metadata={
-                "required": True,
-            }
-        )
+    value: None | int = field(default=None)
@@ -2,35 +2,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT,
+    ELEMENT_REQUIRED,
+)
 from src.models.generated.keywords import Keywords
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Filters:
     class Meta:
         name = "filters"
 
-    id: object = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    term: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    id: str = field(metadata=ATTRIBUTE_REQUIRED)
+    term: str = field(metadata=ELEMENT_REQUIRED)
     filter: list[str] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-        },
-    )
-    keywords: Keywords = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT,
     )
+    keywords: Keywords = field(metadata=ELEMENT_REQUIRED)
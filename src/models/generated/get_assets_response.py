@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT_MIN_OCCURS_1,
+    ELEMENT_REQUIRED,
+)
 from src.models.generated.asset_count import AssetCount
 from src.models.generated.assets import Assets
 from src.models.generated.filters import Filters
@@ -9,51 +14,18 @@ from src.models.generated.host import Asset
 from src.models.generated.sort import Sort
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GetAssetsResponse:
     class Meta:
         name = "get_assets_response"
 
-    status: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    status_text: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    status: int = field(metadata=ATTRIBUTE_REQUIRED)
+    status_text: str = field(metadata=ATTRIBUTE_REQUIRED)
     asset: list[Asset] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-            "min_occurs": 1,
-        },
-    )
-    filters: Filters = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    sort: Sort = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    assets: Assets = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    asset_count: AssetCount = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT_MIN_OCCURS_1,
     )
+    filters: Filters = field(metadata=ELEMENT_REQUIRED)
+    sort: Sort = field(metadata=ELEMENT_REQUIRED)
+    assets: Assets = field(metadata=ELEMENT_REQUIRED)
+    asset_count: AssetCount = field(metadata=ELEMENT_REQUIRED)
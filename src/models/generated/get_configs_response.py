@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT_MIN_OCCURS_1,
+    ELEMENT_REQUIRED,
+)
 from src.models.generated.config import Config
 from src.models.generated.config_count import ConfigCount
 from src.models.generated.configs import Configs
@@ -9,51 +14,18 @@ from src.models.generated.filters import Filters
 from src.models.generated.sort import Sort
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GetConfigsResponse:
     class Meta:
         name = "get_configs_response"
 
-    status: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    status_text: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    status: int = field(metadata=ATTRIBUTE_REQUIRED)
+    status_text: str = field(metadata=ATTRIBUTE_REQUIRED)
     config: list[Config] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-            "min_occurs": 1,
-        },
-    )
-    filters: Filters = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    sort: Sort = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    configs: Configs = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    config_count: ConfigCount = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT_MIN_OCCURS_1,
     )
+    filters: Filters = field(metadata=ELEMENT_REQUIRED)
+    sort: Sort = field(metadata=ELEMENT_REQUIRED)
+    configs: Configs = field(metadata=ELEMENT_REQUIRED)
+    config_count: ConfigCount = field(metadata=ELEMENT_REQUIRED)
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT_MIN_OCCURS_1,
+    ELEMENT_REQUIRED,
+)
 from src.models.generated.filters import Filters
 from src.models.generated.port_list import PortList
 from src.models.generated.port_list_count import PortListCount
@@ -9,51 +14,18 @@ from src.models.generated.port_lists import PortLists
 from src.models.generated.sort import Sort
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GetPortListsResponse:
     class Meta:
         name = "get_port_lists_response"
 
-    status: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    status_text: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    status: int = field(metadata=ATTRIBUTE_REQUIRED)
+    status_text: str = field(metadata=ATTRIBUTE_REQUIRED)
     port_list: list[PortList] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-            "min_occurs": 1,
-        },
-    )
-    filters: Filters = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    sort: Sort = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    port_lists: PortLists = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    port_list_count: PortListCount = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT_MIN_OCCURS_1,
     )
+    filters: Filters = field(metadata=ELEMENT_REQUIRED)
+    sort: Sort = field(metadata=ELEMENT_REQUIRED)
+    port_lists: PortLists = field(metadata=ELEMENT_REQUIRED)
+    port_list_count: PortListCount = field(metadata=ELEMENT_REQUIRED)
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT_MIN_OCCURS_1,
+    ELEMENT_REQUIRED,
+)
 from src.models.generated.filters import Filters
 from src.models.generated.info import Report
 from src.models.generated.report_count import ReportCount
@@ -9,51 +14,18 @@ from src.models.generated.reports import Reports
 from src.models.generated.sort import Sort
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GetReportsResponse:
     class Meta:
         name = "get_reports_response"
 
-    status: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    status_text: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    status: int = field(metadata=ATTRIBUTE_REQUIRED)
+    status_text: str = field(metadata=ATTRIBUTE_REQUIRED)
     report: list[Report] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-            "min_occurs": 1,
-        },
-    )
-    filters: Filters = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    sort: Sort = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    reports: Reports = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    report_count: ReportCount = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT_MIN_OCCURS_1,
     )
+    filters: Filters = field(metadata=ELEMENT_REQUIRED)
+    sort: Sort = field(metadata=ELEMENT_REQUIRED)
+    reports: Reports = field(metadata=ELEMENT_REQUIRED)
+    report_count: ReportCount = field(metadata=ELEMENT_REQUIRED)
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT_MIN_OCCURS_1,
+    ELEMENT_REQUIRED,
+)
 from src.models.generated.filters import Filters
 from src.models.generated.info import Scanner
 from src.models.generated.scanner_count import ScannerCount
@@ -9,51 +14,18 @@ from src.models.generated.scanners import Scanners
 from src.models.generated.sort import Sort
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GetScannersResponse:
     class Meta:
         name = "get_scanners_response"
 
-    status: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    status_text: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    status: int = field(metadata=ATTRIBUTE_REQUIRED)
+    status_text: str = field(metadata=ATTRIBUTE_REQUIRED)
     scanner: list[Scanner] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-            "min_occurs": 1,
-        },
-    )
-    filters: Filters = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    sort: Sort = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    scanners: Scanners = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    scanner_count: ScannerCount = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT_MIN_OCCURS_1,
     )
+    filters: Filters = field(metadata=ELEMENT_REQUIRED)
+    sort: Sort = field(metadata=ELEMENT_REQUIRED)
+    scanners: Scanners = field(metadata=ELEMENT_REQUIRED)
+    scanner_count: ScannerCount = field(metadata=ELEMENT_REQUIRED)
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT_MIN_OCCURS_1,
+    ELEMENT_REQUIRED,
+)
 from src.models.generated.filters import Filters
 from src.models.generated.sort import Sort
 from src.models.generated.target import Target
@@ -9,51 +14,18 @@ from src.models.generated.target_count import TargetCount
 from src.models.generated.targets import Targets
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GetTargetsResponse:
     class Meta:
         name = "get_targets_response"
 
-    status: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    status_text: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    status: int = field(metadata=ATTRIBUTE_REQUIRED)
+    status_text: str = field(metadata=ATTRIBUTE_REQUIRED)
     target: list[Target] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-            "min_occurs": 1,
-        },
-    )
-    filters: Filters = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    sort: Sort = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    targets: Targets = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    target_count: TargetCount = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT_MIN_OCCURS_1,
     )
+    filters: Filters = field(metadata=ELEMENT_REQUIRED)
+    sort: Sort = field(metadata=ELEMENT_REQUIRED)
+    targets: Targets = field(metadata=ELEMENT_REQUIRED)
+    target_count: TargetCount = field(metadata=ELEMENT_REQUIRED)
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT_MIN_OCCURS_1,
+    ELEMENT_REQUIRED,
+)
 from src.models.generated.filters import Filters
 from src.models.generated.info import (
     Task,
@@ -11,57 +16,19 @@ from src.models.generated.sort import Sort
 from src.models.generated.task_count import TaskCount
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GetTasksResponse:
     class Meta:
         name = "get_tasks_response"
 
-    status: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    status_text: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    apply_overrides: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    status: int = field(metadata=ATTRIBUTE_REQUIRED)
+    status_text: str = field(metadata=ATTRIBUTE_REQUIRED)
+    apply_overrides: int = field(metadata=ELEMENT_REQUIRED)
     task: list[Task] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-            "min_occurs": 1,
-        },
-    )
-    filters: Filters = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    sort: Sort = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    tasks: Tasks = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    task_count: TaskCount = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT_MIN_OCCURS_1,
     )
+    filters: Filters = field(metadata=ELEMENT_REQUIRED)
+    sort: Sort = field(metadata=ELEMENT_REQUIRED)
+    tasks: Tasks = field(metadata=ELEMENT_REQUIRED)
+    task_count: TaskCount = field(metadata=ELEMENT_REQUIRED)
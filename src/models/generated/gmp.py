@@ -2,15 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Gmp:
     class Meta:
         name = "gmp"
 
-    version: float = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    version: float = field(metadata=ELEMENT_REQUIRED)
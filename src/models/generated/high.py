@@ -1,22 +1,8 @@
-from __future__ import annotations
+from src.models.generated.severity_count import SeverityCount
 
-from dataclasses import dataclass, field
 
+class High(SeverityCount):
+    __slots__ = ()
 
-@dataclass(kw_only=True)
-class High:
     class Meta:
         name = "high"
-
-    full: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    filtered: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
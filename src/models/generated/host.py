@@ -5,6 +5,7 @@ from typing import ForwardRef
 
 from xsdata.models.datatype import XmlDateTime
 
+from src.models.field_metadata import ATTRIBUTE, ELEMENT, TYPE_ELEMENT
 from src.models.generated.detail import Detail
 from src.models.generated.identifiers import Identifiers
 from src.models.generated.owner import Owner
@@ -12,7 +13,7 @@ from src.models.generated.permissions import Permissions
 from src.models.generated.severity import Severity
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Host:
     class Meta:
         name = "host"
@@ -44,87 +45,60 @@ class Host:
     )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Asset:
     class Meta:
         name = "asset"
 
     id: None | str = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
     owner: None | Owner = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     name: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     comment: None | object = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     creation_time: None | XmlDateTime = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     modification_time: None | XmlDateTime = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     writable: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     in_use: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     permissions: None | Permissions = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     identifiers: None | Identifiers = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     type_value: None | str = field(
         default=None,
-        metadata={
-            "name": "type",
-            "type": "Element",
-        },
+        metadata=TYPE_ELEMENT,
     )
     host: None | Host = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     asset_id: None | str = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
@@ -2,15 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Hosts:
     class Meta:
         name = "hosts"
 
-    count: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    count: int = field(metadata=ELEMENT_REQUIRED)
@@ -4,54 +4,27 @@ from dataclasses import dataclass, field
 
 from xsdata.models.datatype import XmlDateTime
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT,
+    ELEMENT_REQUIRED,
+)
 from src.models.generated.os import Os
 from src.models.generated.source import Source
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Identifier:
     class Meta:
         name = "identifier"
 
-    id: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    value: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    creation_time: XmlDateTime = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    modification_time: XmlDateTime = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    source: Source = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    id: str = field(metadata=ATTRIBUTE_REQUIRED)
+    name: str = field(metadata=ELEMENT_REQUIRED)
+    value: str = field(metadata=ELEMENT_REQUIRED)
+    creation_time: XmlDateTime = field(metadata=ELEMENT_REQUIRED)
+    modification_time: XmlDateTime = field(metadata=ELEMENT_REQUIRED)
+    source: Source = field(metadata=ELEMENT_REQUIRED)
     os: None | Os = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
@@ -5,6 +5,14 @@ from typing import ForwardRef
 
 from xsdata.models.datatype import XmlDateTime
 
+from src.models.field_metadata import (
+    ATTRIBUTE,
+    ATTRIBUTE_REQUIRED,
+    ELEMENT,
+    ELEMENT_REQUIRED,
+    REQUIRED,
+    TYPE_ELEMENT,
+)
 from src.models.generated.apps import Apps
 from src.models.generated.closed_cves import ClosedCves
 from src.models.generated.config import Config
@@ -38,236 +46,196 @@ from src.models.generated.vulns import Vulns
 from src.models.generated.warning import Warning
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Info:
     class Meta:
         name = "info"
 
     scanner: None | Scanner = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     daemon: None | Daemon = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     protocol: None | Protocol = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     description: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     params: None | Params = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     deprecated: None | int = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
     full: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     filtered: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     value: None | int = field(default=None)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Task:
     class Meta:
         name = "task"
 
-    id: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    id: str = field(metadata=ATTRIBUTE_REQUIRED)
     owner: None | Owner = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
-    )
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT,
     )
+    name: str = field(metadata=ELEMENT_REQUIRED)
     comment: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     creation_time: None | XmlDateTime = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     modification_time: None | XmlDateTime = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     writable: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     in_use: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     permissions: None | Permissions = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     alterable: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     usage_type: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     config: None | Config = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     target: None | Target = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     hosts_ordering: None | object = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     scanner: None | Scanner = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     status: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     progress: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     report_count: None | ReportCount = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     trend: None | object = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     schedule: None | Schedule = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     schedule_periods: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     current_report: None | CurrentReport = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     last_report: None | LastReport = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     observers: None | object = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     average_duration: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     result_count: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     preferences: None | Preferences = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ResultCount:
     class Meta:
         name = "result_count"
 
+    @dataclass(kw_only=True, slots=True)
+    class Full:
+        value: int = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class Filtered:
+        value: int = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class Critical:
+        value: Critical | int = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class High:
+        value: High | int = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class Low:
+        value: Low | int = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class Log:
+        value: Log | int = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class Medium:
+        value: Medium | int = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class FalsePositive:
+        value: FalsePositive | int = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class Value:
+        value: int = field(metadata=REQUIRED)
+
     content: list[object] = field(
         default_factory=list,
         metadata={
@@ -277,15 +245,15 @@ class ResultCount:
             "choices": (
                 {
                     "name": "full",
-                    "type": ForwardRef("ResultCount.Full"),
+                    "type": Full,
                 },
                 {
                     "name": "filtered",
-                    "type": ForwardRef("ResultCount.Filtered"),
+                    "type": Filtered,
                 },
                 {
                     "name": "critical",
-                    "type": ForwardRef("ResultCount.Critical"),
+                    "type": Critical,
                 },
                 {
                     "name": "hole",
@@ -293,7 +261,7 @@ class ResultCount:
                 },
                 {
                     "name": "high",
-                    "type": ForwardRef("ResultCount.High"),
+                    "type": High,
                 },
                 {
                     "name": "info",
@@ -301,11 +269,11 @@ class ResultCount:
                 },
                 {
                     "name": "low",
-                    "type": ForwardRef("ResultCount.Low"),
+                    "type": Low,
                 },
                 {
                     "name": "log",
-                    "type": ForwardRef("ResultCount.Log"),
+                    "type": Log,
                 },
                 {
                     "name": "warning",
@@ -313,151 +281,113 @@ class ResultCount:
                 },
                 {
                     "name": "medium",
-                    "type": ForwardRef("ResultCount.Medium"),
+                    "type": Medium,
                 },
                 {
                     "name": "false_positive",
-                    "type": ForwardRef("ResultCount.FalsePositive"),
+                    "type": FalsePositive,
                 },
                 {
-                    "type": ForwardRef("ResultCount.Value"),
+                    "type": Value,
                 },
             ),
         },
     )
 
-    @dataclass(kw_only=True)
-    class Full:
-        value: int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Filtered:
-        value: int = field(
-            metadata={
-                "required": True,
-            }
-        )
 
-    @dataclass(kw_only=True)
-    class Critical:
-        value: Critical | int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class High:
-        value: High | int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Low:
-        value: Low | int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Log:
-        value: Log | int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Medium:
-        value: Medium | int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class FalsePositive:
-        value: FalsePositive | int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Value:
-        value: int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Tasks:
     class Meta:
         name = "tasks"
 
     start: None | int = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
     max: None | int = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
     task: list[Task] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Report:
     class Meta:
         name = "report"
 
-    id: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    @dataclass(kw_only=True, slots=True)
+    class ScanRunStatus:
+        value: str = field(
+            default="",
+            metadata=REQUIRED,
+        )
+
+    @dataclass(kw_only=True, slots=True)
+    class Name:
+        value: XmlDateTime = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class CreationTime:
+        value: XmlDateTime = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class ModificationTime:
+        value: XmlDateTime = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class Writable:
+        value: int = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class InUse:
+        value: int = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class Timestamp:
+        value: XmlDateTime = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class ScanStart:
+        value: XmlDateTime = field(metadata=REQUIRED)
+
+    @dataclass(kw_only=True, slots=True)
+    class Timezone:
+        value: str = field(
+            default="",
+            metadata=REQUIRED,
+        )
+
+    @dataclass(kw_only=True, slots=True)
+    class TimezoneAbbrev:
+        value: str = field(
+            default="",
+            metadata=REQUIRED,
+        )
+
+    @dataclass(kw_only=True, slots=True)
+    class ScanEnd:
+        value: XmlDateTime = field(metadata=REQUIRED)
+
+    id: str = field(metadata=ATTRIBUTE_REQUIRED)
     format_id: None | str = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
     config_id: None | object = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
     extension: None | str = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
     content_type: None | str = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
     content: list[object] = field(
         default_factory=list,
@@ -480,7 +410,7 @@ class Report:
                 },
                 {
                     "name": "scan_run_status",
-                    "type": ForwardRef("Report.ScanRunStatus"),
+                    "type": ScanRunStatus,
                 },
                 {
                     "name": "hosts",
@@ -512,23 +442,23 @@ class Report:
                 },
                 {
                     "name": "name",
-                    "type": ForwardRef("Report.Name"),
+                    "type": Name,
                 },
                 {
                     "name": "creation_time",
-                    "type": ForwardRef("Report.CreationTime"),
+                    "type": CreationTime,
                 },
                 {
                     "name": "modification_time",
-                    "type": ForwardRef("Report.ModificationTime"),
+                    "type": ModificationTime,
                 },
                 {
                     "name": "writable",
-                    "type": ForwardRef("Report.Writable"),
+                    "type": Writable,
                 },
                 {
                     "name": "in_use",
-                    "type": ForwardRef("Report.InUse"),
+                    "type": InUse,
                 },
                 {
                     "name": "task",
@@ -536,19 +466,19 @@ class Report:
                 },
                 {
                     "name": "timestamp",
-                    "type": ForwardRef("Report.Timestamp"),
+                    "type": Timestamp,
                 },
                 {
                     "name": "scan_start",
-                    "type": ForwardRef("Report.ScanStart"),
+                    "type": ScanStart,
                 },
                 {
                     "name": "timezone",
-                    "type": ForwardRef("Report.Timezone"),
+                    "type": Timezone,
                 },
                 {
                     "name": "timezone_abbrev",
-                    "type": ForwardRef("Report.TimezoneAbbrev"),
+                    "type": TimezoneAbbrev,
                 },
                 {
                     "name": "result_count",
@@ -560,7 +490,7 @@ class Report:
                 },
                 {
                     "name": "scan_end",
-                    "type": ForwardRef("Report.ScanEnd"),
+                    "type": ScanEnd,
                 },
                 {
                     "name": "errors",
@@ -578,247 +508,102 @@ class Report:
         },
     )
 
-    @dataclass(kw_only=True)
-    class ScanRunStatus:
-        value: str = field(
-            default="",
-            metadata={
-                "required": True,
-            },
-        )
-
-    @dataclass(kw_only=True)
-    class Name:
-        value: XmlDateTime = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class CreationTime:
-        value: XmlDateTime = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class ModificationTime:
-        value: XmlDateTime = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Writable:
-        value: int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class InUse:
-        value: int = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Timestamp:
-        value: XmlDateTime = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class ScanStart:
-        value: XmlDateTime = field(
-            metadata={
-                "required": True,
-            }
-        )
-
-    @dataclass(kw_only=True)
-    class Timezone:
-        value: str = field(
-            default="",
-            metadata={
-                "required": True,
-            },
-        )
-
-    @dataclass(kw_only=True)
-    class TimezoneAbbrev:
-        value: str = field(
-            default="",
-            metadata={
-                "required": True,
-            },
-        )
-
-    @dataclass(kw_only=True)
-    class ScanEnd:
-        value: XmlDateTime = field(
-            metadata={
-                "required": True,
-            }
-        )
 
-
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Scanner:
     class Meta:
         name = "scanner"
 
     id: None | str = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
     owner: None | Owner = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
-    )
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT,
     )
+    name: str = field(metadata=ELEMENT_REQUIRED)
     comment: None | object = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     creation_time: None | XmlDateTime = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     modification_time: None | XmlDateTime = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     writable: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     in_use: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     permissions: None | Permissions = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     host: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     port: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     type_value: None | int = field(
         default=None,
-        metadata={
-            "name": "type",
-            "type": "Element",
-        },
+        metadata=TYPE_ELEMENT,
     )
     ca_pub: None | object = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     relay_host: None | object = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     relay_port: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     credential: None | Credential = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     tasks: None | Tasks = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     info: None | Info = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     trash: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     version: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CurrentReport:
     class Meta:
         name = "current_report"
 
-    report: Report = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    report: Report = field(metadata=ELEMENT_REQUIRED)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LastReport:
     class Meta:
         name = "last_report"
 
-    report: Report = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    report: Report = field(metadata=ELEMENT_REQUIRED)
@@ -2,27 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Keyword:
     class Meta:
         name = "keyword"
 
-    column: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    relation: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    value: str | int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    column: str = field(metadata=ELEMENT_REQUIRED)
+    relation: str = field(metadata=ELEMENT_REQUIRED)
+    value: str | int = field(metadata=ELEMENT_REQUIRED)
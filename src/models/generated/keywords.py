@@ -2,18 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_MIN_OCCURS_1
 from src.models.generated.keyword import Keyword
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Keywords:
     class Meta:
         name = "keywords"
 
     keyword: list[Keyword] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-            "min_occurs": 1,
-        },
+        metadata=ELEMENT_MIN_OCCURS_1,
     )
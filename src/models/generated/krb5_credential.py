@@ -2,27 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT,
+    ELEMENT_REQUIRED,
+)
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Krb5Credential:
     class Meta:
         name = "krb5_credential"
 
-    id: object = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    name: None | object = field(
+    id: str = field(metadata=ATTRIBUTE_REQUIRED)
+    name: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
-    )
-    trash: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT,
     )
+    trash: int = field(metadata=ELEMENT_REQUIRED)
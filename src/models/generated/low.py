@@ -1,22 +1,8 @@
-from __future__ import annotations
+from src.models.generated.severity_count import SeverityCount
 
-from dataclasses import dataclass, field
 
+class Low(SeverityCount):
+    __slots__ = ()
 
-@dataclass(kw_only=True)
-class Low:
     class Meta:
         name = "low"
-
-    full: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    filtered: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
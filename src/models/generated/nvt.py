@@ -2,34 +2,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT_REQUIRED,
+    TYPE_ELEMENT_REQUIRED,
+)
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Nvt:
     class Meta:
         name = "nvt"
 
-    oid: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    type_value: str = field(
-        metadata={
-            "name": "type",
-            "type": "Element",
-            "required": True,
-        }
-    )
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    cvss_base: float = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    oid: str = field(metadata=ATTRIBUTE_REQUIRED)
+    type_value: str = field(metadata=TYPE_ELEMENT_REQUIRED)
+    name: str = field(metadata=ELEMENT_REQUIRED)
+    cvss_base: float = field(metadata=ELEMENT_REQUIRED)
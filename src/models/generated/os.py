@@ -2,27 +2,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ATTRIBUTE, ELEMENT
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Os:
     class Meta:
         name = "os"
 
     id: None | str = field(
         default=None,
-        metadata={
-            "type": "Attribute",
-        },
+        metadata=ATTRIBUTE,
     )
     title: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     count: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
@@ -2,15 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Owner:
     class Meta:
         name = "owner"
 
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    name: str = field(metadata=ELEMENT_REQUIRED)
@@ -2,46 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_REQUIRED, TYPE_ELEMENT_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Param:
     class Meta:
         name = "param"
 
-    id: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    default: int | str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    description: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    type_value: str = field(
-        metadata={
-            "name": "type",
-            "type": "Element",
-            "required": True,
-        }
-    )
-    mandatory: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    id: str = field(metadata=ELEMENT_REQUIRED)
+    name: str = field(metadata=ELEMENT_REQUIRED)
+    default: int | str = field(metadata=ELEMENT_REQUIRED)
+    description: str = field(metadata=ELEMENT_REQUIRED)
+    type_value: str = field(metadata=TYPE_ELEMENT_REQUIRED)
+    mandatory: int = field(metadata=ELEMENT_REQUIRED)
@@ -2,15 +2,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Permission:
     class Meta:
         name = "permission"
 
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    name: str = field(metadata=ELEMENT_REQUIRED)
@@ -2,27 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class PortCount:
     class Meta:
         name = "port_count"
 
-    all: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    tcp: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    udp: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    all: int = field(metadata=ELEMENT_REQUIRED)
+    tcp: int = field(metadata=ELEMENT_REQUIRED)
+    udp: int = field(metadata=ELEMENT_REQUIRED)
@@ -4,92 +4,65 @@ from dataclasses import dataclass, field
 
 from xsdata.models.datatype import XmlDateTime
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT,
+    ELEMENT_REQUIRED,
+)
 from src.models.generated.owner import Owner
 from src.models.generated.permissions import Permissions
 from src.models.generated.port_count import PortCount
 from src.models.generated.port_ranges import PortRanges
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PortList:
     class Meta:
         name = "port_list"
 
-    id: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    id: str = field(metadata=ATTRIBUTE_REQUIRED)
     owner: None | Owner = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
-    )
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
+        metadata=ELEMENT,
     )
+    name: str = field(metadata=ELEMENT_REQUIRED)
     comment: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     creation_time: None | XmlDateTime = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     modification_time: None | XmlDateTime = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     writable: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     in_use: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     permissions: None | Permissions = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     port_count: None | PortCount = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     predefined: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     port_ranges: None | PortRanges = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     trash: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
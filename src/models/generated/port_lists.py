@@ -2,21 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ATTRIBUTE_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class PortLists:
     class Meta:
         name = "port_lists"
 
-    start: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    max: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    start: int = field(metadata=ATTRIBUTE_REQUIRED)
+    max: int = field(metadata=ATTRIBUTE_REQUIRED)
@@ -2,40 +2,24 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import (
+    ATTRIBUTE_REQUIRED,
+    ELEMENT,
+    ELEMENT_REQUIRED,
+    TYPE_ELEMENT_REQUIRED,
+)
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class PortRange:
     class Meta:
         name = "port_range"
 
-    id: str = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
-    start: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    end: int = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    type_value: str = field(
-        metadata={
-            "name": "type",
-            "type": "Element",
-            "required": True,
-        }
-    )
-    comment: None | object = field(
+    id: str = field(metadata=ATTRIBUTE_REQUIRED)
+    start: int = field(metadata=ELEMENT_REQUIRED)
+    end: int = field(metadata=ELEMENT_REQUIRED)
+    type_value: str = field(metadata=TYPE_ELEMENT_REQUIRED)
+    comment: None | str = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
@@ -2,27 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_REQUIRED
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Preference:
     class Meta:
         name = "preference"
 
-    name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    scanner_name: str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
-    value: int | str = field(
-        metadata={
-            "type": "Element",
-            "required": True,
-        }
-    )
+    name: str = field(metadata=ELEMENT_REQUIRED)
+    scanner_name: str = field(metadata=ELEMENT_REQUIRED)
+    value: int | str = field(metadata=ELEMENT_REQUIRED)
@@ -2,18 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ELEMENT_MIN_OCCURS_1
 from src.models.generated.preference import Preference
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Preferences:
     class Meta:
         name = "preferences"
 
     preference: list[Preference] = field(
         default_factory=list,
-        metadata={
-            "type": "Element",
-            "min_occurs": 1,
-        },
+        metadata=ELEMENT_MIN_OCCURS_1,
     )
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from src.models.field_metadata import ELEMENT_REQUIRED
+
+
+@dataclass(kw_only=True, slots=True)
+class SeverityCount:
+    full: int = field(metadata=ELEMENT_REQUIRED)
+    filtered: int = field(metadata=ELEMENT_REQUIRED)
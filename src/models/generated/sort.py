@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from src.models.generated.field_mod import FieldType
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Sort:
     class Meta:
         name = "sort"
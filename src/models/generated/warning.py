@@ -2,28 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from src.models.field_metadata import ATTRIBUTE_REQUIRED, ELEMENT
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class Warning:
     class Meta:
         name = "warning"
 
-    deprecated: int = field(
-        metadata={
-            "type": "Attribute",
-            "required": True,
-        }
-    )
+    deprecated: int = field(metadata=ATTRIBUTE_REQUIRED)
     full: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     filtered: None | int = field(
         default=None,
-        metadata={
-            "type": "Element",
-        },
+        metadata=ELEMENT,
     )
     value: None | int = field(default=None)
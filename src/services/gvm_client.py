@@ -11,9 +11,11 @@ from __future__ import annotations
 
 import inspect
 import dataclasses
-import functools
 import logging
 import re
+import sys
+import threading
+import time
 import types
 
 import xml.etree.ElementTree as etree
@@ -21,12 +23,12 @@ from contextlib import contextmanager
 from dataclasses import MISSING
 from typing import (
     Any,
-    Iterable,
     Optional,
     TypeVar,
     Union,
     Sequence,
     Mapping,
+    NamedTuple,
     Generator,
     get_args,
     get_origin,
@@ -41,14 +43,91 @@ from gvm.protocols.gmp import GMPv227 as Gmp
 from gvm.transforms import EtreeCheckCommandTransform
 from gvm.protocols.gmp.requests.v227 import EntityID, ReportFormatType, HostsOrdering
 
+from xsdata.formats.dataclass.context import XmlContext
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.parsers import XmlParser
+from xsdata.formats.dataclass.parsers.handlers import LxmlEventHandler
 
 import src.models.generated as models
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
+# xsdata builds binding metadata for each model class on first use and caches
+# it on the context; sharing one context lets every client reuse that work.
+_XML_CONTEXT = XmlContext()
+
+# Fields whose values come from small closed sets (port types, filter keyword
+# columns/relations, scanner preference names); parsed values are interned so
+# large responses share one string object per distinct value.
+_INTERNED_FIELDS = frozenset({"type_value", "column", "relation", "scanner_name"})
+
+# Matches an explicit `rows=` keyword in a GMP filter string.
+_ROWS_FILTER_RE = re.compile(r"(?:^|\s)rows\s*=")
+
+# How long parsed port list, scanner and scan config listings are reused.
+# These entities change rarely, and the MCP tools query them repeatedly.
+_READ_CACHE_TTL = 30.0
+
+# Upper bound on cached listings; the key includes free-form filter strings,
+# so the oldest entry is evicted once this many are held.
+_READ_CACHE_MAXSIZE = 64
+
+# Root models of every GMP response parsed by the client; their binding
+# metadata is built up front so the first tool call does not pay for it.
+_RESPONSE_MODELS: tuple[type[Any], ...] = (
+    models.AuthenticateResponse,
+    models.GetTargetsResponse,
+    models.CreateTargetResponse,
+    models.GetTasksResponse,
+    models.CreateTaskResponse,
+    models.StartTaskResponse,
+    models.StopTaskResponse,
+    models.GetPortListsResponse,
+    models.GetReportsResponse,
+    models.GetScannersResponse,
+    models.GetConfigsResponse,
+)
+
+
+class _ClassMeta(NamedTuple):
+    """Per-class data used by ``GvmClient._xsdata_class_factory``."""
+
+    nullable: frozenset[str]
+    required: tuple[str, ...]
+    # False when no parameter value can need rewriting (no None-accepting or
+    # interned fields), so the factory can pass xsdata's params through.
+    rewrites: bool
+
+
+# Filled lazily by ``GvmClient._build_class_meta``; a plain dict lookup keeps
+# the per-element cost of the class factory to a single hash probe.
+_CLASS_META: dict[type[Any], _ClassMeta] = {}
+
+# Parameter names of GMP command functions, filled by
+# ``GvmClient._command_parameters`` so each signature is inspected only once.
+_COMMAND_PARAMETERS: dict[Any, frozenset[str]] = {}
+
+# Names of GMP command parameters whose python-gvm default is None, filled by
+# ``GvmClient._optional_parameters``.
+_OPTIONAL_PARAMETERS: dict[Any, frozenset[str]] = {}
+
+
+def _is_transport_error(err: Exception) -> bool:
+    """
+    Tell whether an error came from the connection rather than from gvmd.
+
+    python-gvm raises a plain `GvmError` (or lets an `OSError` through) when
+    the socket fails; rejected commands and invalid arguments use subclasses.
+
+    Args:
+        err (Exception): Error raised while sending a GMP command.
+
+    Returns:
+        bool: True if the session should be reconnected.
+    """
+    return isinstance(err, OSError) or type(err) is GvmError
+
 
 class GvmClient:
     """
@@ -66,6 +145,10 @@ class GvmClient:
         self._transform = EtreeCheckCommandTransform()
         self._username = username
         self._password = password
+        self._gmp: Optional[Gmp] = None
+        self._session_lock = threading.Lock()
+        self._read_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        self._read_cache_lock = threading.Lock()
 
         self._xml_parser = XmlParser(
             config=ParserConfig(
@@ -73,10 +156,14 @@ class GvmClient:
                 fail_on_unknown_attributes=False,
                 class_factory=self._xsdata_class_factory,
             ),
+            context=_XML_CONTEXT,
+            # GMP responses arrive as lxml elements from the transform.
+            handler=LxmlEventHandler,
         )
+        for model in _RESPONSE_MODELS:
+            _XML_CONTEXT.build_recursive(model)
 
     @staticmethod
-    @functools.lru_cache(maxsize=1024)
     def _resolved_type_hints(clazz: type[Any]) -> dict[str, Any]:
         """
         Return resolved type hints for a class.
@@ -111,19 +198,19 @@ class GvmClient:
         return origin is None and type(None) in get_args(field_type)
 
     @staticmethod
-    def _xsdata_class_factory(clazz: type[T], params: dict[str, Any]) -> T:
+    def _build_class_meta(clazz: type[Any]) -> _ClassMeta:
         """
-        Instantiate dataclasses for xsdata parsing.
+        Collect the per-class data used by the xsdata class factory.
 
-        Empty strings are converted to None when the target field supports None,
-        and missing required init fields are populated with None.
+        The result is stored in the module-level class cache, so each
+        dataclass is inspected only once per process.
 
         Args:
-            clazz (type[T]): Dataclass type to instantiate.
-            params (dict[str, Any]): Constructor parameters from parsed XML.
+            clazz (type[Any]): Dataclass to inspect.
 
         Returns:
-            T: Instantiated dataclass object.
+            _ClassMeta: Names of the fields accepting None and of the required
+            init fields, and whether any parameter may need rewriting.
 
         Raises:
             TypeError: If clazz is not a dataclass.
@@ -133,36 +220,77 @@ class GvmClient:
                 f"xsdata class factory received a non-dataclass type: {clazz!r}"
             )
 
+        fields = dataclasses.fields(clazz)
         resolved = GvmClient._resolved_type_hints(clazz)
-        field_types = {
-            f.name: resolved.get(f.name, f.type) for f in dataclasses.fields(clazz)
-        }
-
-        cleaned: dict[str, Any] = {}
-        for key, value in params.items():
-            if value == "" and GvmClient._allows_none(field_types.get(key, Any)):
-                cleaned[key] = None
-            else:
-                cleaned[key] = value
-
-        for f in dataclasses.fields(clazz):
-            if not f.init:
-                continue
-            if f.name in cleaned:
-                continue
-            required = (
-                f.default is MISSING
-                and getattr(f, "default_factory", MISSING) is MISSING
-            )
-            if required:
-                cleaned[f.name] = None
+        nullable = frozenset(
+            f.name
+            for f in fields
+            if GvmClient._allows_none(resolved.get(f.name, f.type))
+        )
+        meta = _ClassMeta(
+            nullable=nullable,
+            required=tuple(
+                f.name
+                for f in fields
+                if f.init
+                and f.default is MISSING
+                and f.default_factory is MISSING
+            ),
+            rewrites=bool(nullable)
+            or any(f.name in _INTERNED_FIELDS for f in fields),
+        )
+        _CLASS_META[clazz] = meta
+        return meta
+
+    @staticmethod
+    def _xsdata_class_factory(clazz: type[T], params: dict[str, Any]) -> T:
+        """
+        Instantiate dataclasses for xsdata parsing.
+
+        Empty strings are converted to None when the target field supports None,
+        enum-like string fields are interned, and missing required init fields
+        are populated with None.
+
+        Args:
+            clazz (type[T]): Dataclass type to instantiate.
+            params (dict[str, Any]): Constructor parameters from parsed XML.
+
+        Returns:
+            T: Instantiated dataclass object.
+
+        Raises:
+            TypeError: If clazz is not a dataclass.
+        """
+        meta = _CLASS_META.get(clazz) or GvmClient._build_class_meta(clazz)
+
+        if meta.rewrites:
+            nullable = meta.nullable
+            cleaned: dict[str, Any] = {}
+            for key, value in params.items():
+                if value == "" and key in nullable:
+                    cleaned[key] = None
+                elif key in _INTERNED_FIELDS and isinstance(value, str):
+                    cleaned[key] = sys.intern(value)
+                else:
+                    cleaned[key] = value
+        else:
+            # xsdata builds a fresh params dict per element, so it can be
+            # completed in place.
+            cleaned = params
+
+        for name in meta.required:
+            cleaned.setdefault(name, None)
 
         return clazz(**cleaned)  # type: ignore[misc]
 
     @contextmanager
     def _session(self, authenticate: bool = True) -> Generator[Gmp, None, None]:
         """
-        Yield a GMP session.
+        Yield the shared GMP session, connecting and authenticating on demand.
+
+        The session is kept open between calls. python-gvm disconnects a
+        protocol instance when a request fails at the transport level, so a
+        new session is opened whenever the cached one is no longer connected.
 
         Args:
             authenticate (bool): Whether to authenticate with configured credentials.
@@ -170,21 +298,43 @@ class GvmClient:
         Yields:
             Generator[Gmp, None, None]: Active GMP session.
         """
-        with Gmp(connection=self._connection, transform=self._transform) as gmp:
-            if authenticate and self._username and self._password:
+        with self._session_lock:
+            gmp = self._gmp
+            if gmp is None or not gmp.is_connected():
+                gmp = Gmp(connection=self._connection, transform=self._transform)
+                gmp.connect()
+                self._gmp = gmp
+            if (
+                authenticate
+                and not gmp.is_authenticated()
+                and self._username
+                and self._password
+            ):
                 gmp.authenticate(self._username, self._password)
             yield gmp
 
-    def _check_method_args(self, command: Any, args: Iterable[str]) -> bool:
+    def close(self) -> None:
+        """
+        Close the shared GMP session, if one is open.
+        """
+        with self._session_lock:
+            if self._gmp is not None:
+                self._gmp.disconnect()
+                self._gmp = None
+
+    @staticmethod
+    def _command_parameters(command: Any) -> frozenset[str]:
         """
-        Check whether at least one argument is supported by a command signature.
+        Return the parameter names accepted by a GMP command.
+
+        Names are cached per underlying function, so each command signature is
+        inspected only once per process.
 
         Args:
             command (Any): Callable GMP command.
-            args (Iterable[str]): Argument names to validate.
 
         Returns:
-            bool: True if any provided argument exists in the command signature.
+            frozenset[str]: Names of the parameters in the command signature.
 
         Raises:
             GvmError: If command is not callable.
@@ -192,39 +342,100 @@ class GvmClient:
         if not callable(command):
             raise GvmError(f"Command {command} is not callable")
 
-        sig = inspect.signature(command)
-        for arg in args:
-            if arg in sig.parameters.keys():
-                return True
-        return False
+        # A new Gmp instance is created whenever the session reconnects, so key
+        # the cache on the underlying function rather than the bound method.
+        func = getattr(command, "__func__", command)
+        parameters = _COMMAND_PARAMETERS.get(func)
+        if parameters is None:
+            parameters = frozenset(inspect.signature(command).parameters)
+            _COMMAND_PARAMETERS[func] = parameters
+        return parameters
+
+    @staticmethod
+    def _optional_parameters(func: Any) -> frozenset[str]:
+        """
+        Return the parameters of a GMP command whose default is None.
+
+        Passing None for these is the same as omitting them, so only they are
+        safe to drop. Names are cached per function.
+
+        Args:
+            func (Any): GMP command function, as defined on the protocol class.
+
+        Returns:
+            frozenset[str]: Names of the parameters defaulting to None.
+        """
+        optional = _OPTIONAL_PARAMETERS.get(func)
+        if optional is None:
+            optional = frozenset(
+                name
+                for name, parameter in inspect.signature(func).parameters.items()
+                if parameter.default is None
+            )
+            _OPTIONAL_PARAMETERS[func] = optional
+        return optional
 
     def _add_rows_to_filter_string(self, command: Any, kwargs: dict[str, Any]) -> None:
         """
         Add `rows=-1` to `filter_string` when supported and not already specified.
 
+        Nothing is added when the caller selects a stored filter via
+        `filter_id` or disables pagination with `ignore_pagination`.
+
         Args:
             command (Any): GMP command to inspect.
             kwargs (dict[str, Any]): Keyword arguments to mutate in place.
         """
+        if kwargs.get("filter_id") is not None or kwargs.get("ignore_pagination"):
+            return
 
-        if self._check_method_args(command, ["filter_string"]):
+        if "filter_string" in self._command_parameters(command):
             filter_string = kwargs.get("filter_string") or ""
             # Respect explicit pagination in the caller-provided filter.
             # This keeps default behaviour (no pagination) while still allowing
             # tools to request `rows=1`, `rows=10`, etc.
-            if filter_string and re.search(r"(?:^|\\s)rows\\s*=", filter_string):
+            if "rows" in filter_string and _ROWS_FILTER_RE.search(filter_string):
                 return
 
             kwargs["filter_string"] = (
                 f"{filter_string} rows=-1".strip() if filter_string else "rows=-1"
             )
 
+    def _send_command(
+        self, method_name: str, authenticate: bool, kwargs: dict[str, Any]
+    ) -> etree.Element:
+        """
+        Send one GMP command over the shared session.
+
+        Args:
+            method_name (str): GMP method name to invoke.
+            authenticate (bool): Whether to authenticate the session first.
+            kwargs (dict[str, Any]): Keyword arguments forwarded to the GMP method.
+
+        Returns:
+            etree.Element: XML response returned by GMP.
+        """
+        with self._session(authenticate=authenticate) as gmp:
+            command = getattr(gmp, method_name)
+
+            # This is needed to avoid pagination and get all results.
+            self._add_rows_to_filter_string(command, kwargs)
+
+            result: etree.Element = command(**kwargs)
+            return result
+
     def _call(
         self, method_name: str, *, authenticate: bool = True, **kwargs: Any
     ) -> etree.Element:
         """
         Invoke a GMP method with the given arguments.
 
+        If the shared session fails at the transport level (for example
+        because gvmd restarted or closed the idle socket), the session is
+        dropped. Read-only `get_*` commands are then retried once on a fresh
+        connection. Other commands are not resent, because gvmd may already
+        have run them before the failure.
+
         Args:
             method_name (str): GMP method name to invoke.
             authenticate (bool): Whether to authenticate the session first.
@@ -237,44 +448,94 @@ class GvmClient:
             GvmError: If the method does not exist or GMP call fails.
         """
         try:
-            with self._session(authenticate=authenticate) as gmp:
-                command = getattr(gmp, method_name, None)
-                if command is None:
-                    raise GvmError(f"Unknown GMP method: {method_name}")
-
-                # This is needed to avoid pagination and get all results.
-                self._add_rows_to_filter_string(command, kwargs)
-
-                result: etree.Element = command(**kwargs)
-                return result
+            func = getattr(Gmp, method_name, None)
+            if func is None:
+                raise GvmError(f"Unknown GMP method: {method_name}")
+
+            # Unset optional arguments are left to python-gvm's own defaults.
+            # Required arguments and those with another default (such as
+            # `details=True`) are passed on as given, so python-gvm still
+            # validates them.
+            optional = self._optional_parameters(func)
+            kwargs = {
+                key: value
+                for key, value in kwargs.items()
+                if value is not None or key not in optional
+            }
+
+            try:
+                return self._send_command(method_name, authenticate, kwargs)
+            except (GvmError, OSError) as err:
+                if not _is_transport_error(err):
+                    raise
+                self.close()
+                if not method_name.startswith("get_"):
+                    raise
+                logger.warning(
+                    "GMP call %s failed on the shared session, retrying: %s",
+                    method_name,
+                    err,
+                )
+                return self._send_command(method_name, authenticate, kwargs)
         except GvmError as err:
-            logger.exception("GMP call %s failed: %s", method_name, str(err))
+            # GMP errors are expected (bad IDs, missing permissions) and are
+            # reported to the MCP client; keep tracebacks for debug logging.
+            logger.error(
+                "GMP call %s failed: %s",
+                method_name,
+                err,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             raise
 
-    def _xml_text(self, root: etree.Element) -> str:
+    def _parse(self, root: etree.Element, cls: type[T]) -> T:
         """
-        Convert an XML element to a Unicode string.
+        Parse an XML element into a typed model.
+
+        The element returned by the GMP transform is bound directly, without
+        serializing it back to text first.
 
         Args:
-            root (etree.Element): XML root element.
+            root (etree.Element): XML root element to parse.
+            cls (type[T]): Target model class.
 
         Returns:
-            str: Serialized XML.
+            T: Parsed model instance.
         """
-        return etree.tostring(root, encoding="unicode")
+        return self._xml_parser.parse(root, clazz=cls)
 
-    def _parse(self, root: etree.Element, cls: type[T]) -> T:
+    def _cached_read(self, method_name: str, cls: type[T], **kwargs: Any) -> T:
         """
-        Parse an XML element into a typed model.
+        Invoke a read-only GMP method, reusing a recent parsed response.
+
+        Responses are cached per method and arguments for `_READ_CACHE_TTL`
+        seconds, keeping at most `_READ_CACHE_MAXSIZE` entries. The same model instance is returned to every caller within
+        that window, so callers must treat it as read-only.
 
         Args:
-            root (etree.Element): XML root element to parse.
+            method_name (str): GMP method name to invoke.
             cls (type[T]): Target model class.
+            **kwargs (Any): Keyword arguments forwarded to the GMP method.
 
         Returns:
             T: Parsed model instance.
         """
-        return self._xml_parser.parse(root, clazz=cls)
+        key = (method_name, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._read_cache_lock:
+            cached = self._read_cache.get(key)
+            if cached is not None:
+                if now - cached[0] < _READ_CACHE_TTL:
+                    return cached[1]
+                del self._read_cache[key]
+
+        response = self._parse(self._call(method_name, **kwargs), cls)
+        with self._read_cache_lock:
+            # Dicts keep insertion order, so the first key is the oldest.
+            while len(self._read_cache) >= _READ_CACHE_MAXSIZE:
+                del self._read_cache[next(iter(self._read_cache))]
+            self._read_cache[key] = (now, response)
+        return response
 
     def authenticate(self) -> models.AuthenticateResponse:
         """
@@ -283,7 +544,7 @@ class GvmClient:
         Returns:
             models.AuthenticateResponse: Authentication response payload.
         """
-        with Gmp(connection=self._connection, transform=self._transform) as gmp:            
+        with self._session(authenticate=False) as gmp:
             response = gmp.authenticate(username=self._username, password=self._password)
         return self._parse(response, models.AuthenticateResponse)
 
@@ -392,6 +653,9 @@ class GvmClient:
         """
         Request a list of port lists.
 
+        The response may be served from a short-lived cache shared by all
+        callers; treat it as read-only.
+
         Args:
             filter_string (Optional[str]): Filter term for the query.
             filter_id (Optional[EntityID]): Existing filter UUID for the query.
@@ -402,15 +666,15 @@ class GvmClient:
         Returns:
             models.GetPortListsResponse: Port lists response payload.
         """
-        root = self._call(
+        return self._cached_read(
             "get_port_lists",
+            models.GetPortListsResponse,
             filter_string=filter_string,
             filter_id=filter_id,
             details=details,
             targets=targets,
             trash=trash,
         )
-        return self._parse(root, models.GetPortListsResponse)
 
     def create_target(
         self,
@@ -479,6 +743,8 @@ class GvmClient:
             port_range=port_range,
             port_list_id=port_list_id,
         )
+        # Cached listings may embed the targets/tasks using each entity.
+        self._read_cache.clear()
         return self._parse(root, models.CreateTargetResponse)
 
     def create_task(
@@ -535,6 +801,8 @@ class GvmClient:
             observers=observers,
             preferences=preferences,
         )
+        # Cached listings may embed the targets/tasks using each entity.
+        self._read_cache.clear()
         return self._parse(root, models.CreateTaskResponse)
 
     def start_task(self, task_id: EntityID) -> models.StartTaskResponse:
@@ -548,6 +816,8 @@ class GvmClient:
             models.StartTaskResponse: Task start response payload.
         """
         root = self._call("start_task", task_id=task_id)
+        # Cached listings may embed the targets/tasks using each entity.
+        self._read_cache.clear()
         return self._parse(root, models.StartTaskResponse)
 
     def get_reports(
@@ -638,6 +908,9 @@ class GvmClient:
         """
         Request a list of scanners.
 
+        The response may be served from a short-lived cache shared by all
+        callers; treat it as read-only.
+
         Args:
             filter_string (Optional[str]): Filter term for the query.
             filter_id (Optional[EntityID]): Existing filter UUID for the query.
@@ -648,14 +921,14 @@ class GvmClient:
         Returns:
             models.GetScannersResponse: Scanners response payload.
         """
-        root = self._call(
+        return self._cached_read(
             "get_scanners",
+            models.GetScannersResponse,
             filter_string=filter_string,
             filter_id=filter_id,
             details=details,
             trash=trash,
         )
-        return self._parse(root, models.GetScannersResponse)
 
     def get_scan_configs(
         self,
@@ -671,6 +944,9 @@ class GvmClient:
         """
         Request a list of scan configs.
 
+        The response may be served from a short-lived cache shared by all
+        callers; treat it as read-only.
+
         Args:
             filter_string (Optional[str]): Filter term for the query.
             filter_id (Optional[EntityID]): Existing filter UUID for the query.
@@ -686,8 +962,9 @@ class GvmClient:
         Returns:
             models.GetConfigsResponse: Scan configs response payload.
         """
-        root = self._call(
+        return self._cached_read(
             "get_scan_configs",
+            models.GetConfigsResponse,
             filter_string=filter_string,
             filter_id=filter_id,
             trash=trash,
@@ -696,7 +973,6 @@ class GvmClient:
             preferences=preferences,
             tasks=tasks,
         )
-        return self._parse(root, models.GetConfigsResponse)
 
     def stop_task(self, task_id: EntityID) -> models.StopTaskResponse:
         """
@@ -709,4 +985,6 @@ class GvmClient:
             models.StopTaskResponse: Task stop response payload.
         """
         root = self._call("stop_task", task_id=task_id)
+        # Cached listings may embed the targets/tasks using each entity.
+        self._read_cache.clear()
         return self._parse(root, models.StopTaskResponse)
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2026 Matteo Colazilli
 
+import asyncio
 import logging
 from typing import Annotated, Any
 
@@ -37,7 +38,7 @@ def register_inspection_control_tools(
     async def get_targets() -> dict[str, Any]:
 
         try:
-            response = gvm_client.get_targets()
+            response = await asyncio.to_thread(gvm_client.get_targets)
         except Exception as exc:
             logger.error("Error in get_targets: %s", exc)
             raise ToolError(str(exc)) from exc
@@ -72,7 +73,10 @@ def register_inspection_control_tools(
     ) -> dict[str, Any]:
 
         try:
-            response = gvm_client.get_target(target_id=target_id)
+            response = await asyncio.to_thread(
+                gvm_client.get_target,
+                target_id=target_id,
+            )
             target = response.target[0]
             result = {
                 "id": target.id,
@@ -97,7 +101,7 @@ def register_inspection_control_tools(
     async def get_tasks() -> dict[str, Any]:
 
         try:
-            response = gvm_client.get_tasks(details=True)
+            response = await asyncio.to_thread(gvm_client.get_tasks, details=True)
             tasks = response.task
             result = {}
             for task in tasks:
@@ -127,7 +131,7 @@ def register_inspection_control_tools(
     async def get_port_lists() -> dict[str, Any]:
 
         try:
-            response = gvm_client.get_port_lists(details=True)
+            response = await asyncio.to_thread(gvm_client.get_port_lists, details=True)
             port_lists = response.port_list
             result = {}
             for port_list in port_lists:
@@ -153,7 +157,7 @@ def register_inspection_control_tools(
     ) -> dict[str, Any]:
 
         try:
-            response = gvm_client.start_task(task_id=task_id)
+            response = await asyncio.to_thread(gvm_client.start_task, task_id=task_id)
         except RequiredArgument as exc:
             raise ToolError(f"Missing required argument: {exc.argument}") from exc
         except GvmError as exc:
@@ -174,7 +178,7 @@ def register_inspection_control_tools(
     ) -> dict[str, Any]:
 
         try:
-            gvm_client.stop_task(task_id=task_id)
+            await asyncio.to_thread(gvm_client.stop_task, task_id=task_id)
         except RequiredArgument as exc:
             raise ToolError(f"Missing required argument: {exc.argument}") from exc
         except GvmError as exc:
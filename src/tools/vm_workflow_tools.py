@@ -3,6 +3,7 @@
 
 """Tool handlers for vulnerability scanning."""
 
+import asyncio
 from typing import Annotated, Any, Optional
 
 from fastmcp.exceptions import ToolError
@@ -123,7 +124,10 @@ def register_vm_workflow_tools(
         }
 
         try:
-            target_response = gvm_client.create_target(**create_target_kwargs)
+            target_response = await asyncio.to_thread(
+                gvm_client.create_target,
+                **create_target_kwargs,
+            )
         except GvmError as exc:
             raise ToolError(f"Failed to create target: {str(exc)}") from exc
 
@@ -131,7 +135,8 @@ def register_vm_workflow_tools(
         target_id = target_response.id
 
         try:
-            task_response = gvm_client.create_task(
+            task_response = await asyncio.to_thread(
+                gvm_client.create_task,
                 name=task_name,
                 config_id=const.FULL_AND_FAST_SCAN_CONFIG_ID,
                 target_id=target_id,
@@ -143,7 +148,10 @@ def register_vm_workflow_tools(
         task_id = task_response.id
 
         try:
-            start_task_response = gvm_client.start_task(task_id=task_id)
+            start_task_response = await asyncio.to_thread(
+                gvm_client.start_task,
+                task_id=task_id,
+            )
         except GvmError as exc:
             raise ToolError(f"Failed to start task: {str(exc)}") from exc
 
@@ -173,7 +181,10 @@ def register_vm_workflow_tools(
     ) -> dict[str, Any]:
 
         try:
-            task_response = gvm_client.get_task(task_id=task_id)
+            task_response = await asyncio.to_thread(
+                gvm_client.get_task,
+                task_id=task_id,
+            )
         except RequiredArgument as exc:
             raise ToolError(f"Missing required argument: {exc.argument}") from exc
         except GvmError as exc:
@@ -195,7 +206,10 @@ def register_vm_workflow_tools(
     ) -> dict[str, Any]:
 
         try:
-            get_task_response = gvm_client.get_task(task_id=task_id)
+            get_task_response = await asyncio.to_thread(
+                gvm_client.get_task,
+                task_id=task_id,
+            )
         except RequiredArgument as exc:
             raise ToolError(f"Missing required argument: {exc.argument}") from exc
         except GvmError as exc:
@@ -216,7 +230,8 @@ def register_vm_workflow_tools(
             raise ToolError(f"No reports are available yet for task {task_id}.")
 
         try:
-            get_report_response = gvm_client.get_report(
+            get_report_response = await asyncio.to_thread(
+                gvm_client.get_report,
                 report_id=report_id,
                 filter_string="levels=chml",  # Filters by Critical, High, Medium, and Low severity issues
                 report_format_id=const.DEFAULT_REPORT_FORMAT_ID,
@@ -253,7 +268,10 @@ def register_vm_workflow_tools(
     ) -> dict[str, Any]:
         
         try:
-            get_tasks_response = gvm_client.get_task(task_id=task_id)
+            get_tasks_response = await asyncio.to_thread(
+                gvm_client.get_task,
+                task_id=task_id,
+            )
         except GvmError as exc:
             raise ToolError(f"Failed to retrieve task: {str(exc)}") from exc
 
@@ -263,7 +281,10 @@ def register_vm_workflow_tools(
             raise ToolError(f"No tasks found for task ID {task_id}.")
         
         try:
-            start_task_response = gvm_client.start_task(task_id=task_id)
+            start_task_response = await asyncio.to_thread(
+                gvm_client.start_task,
+                task_id=task_id,
+            )
         except GvmError as exc:
             raise ToolError(f"Failed to start task: {str(exc)}") from exc
 
@@ -308,8 +329,11 @@ def register_vm_workflow_tools(
     ) -> dict[str, Any]:
 
         try:
-            get_reports_response = gvm_client.get_reports(
-                filter_string=f"~{task_id} sort-reverse=date", details=True
+            get_reports_response = await asyncio.to_thread(
+                gvm_client.get_reports,
+                # Only the two newest reports are compared.
+                filter_string=f"~{task_id} sort-reverse=date rows=2",
+                details=True,
             )
         except GvmError as exc:
             raise ToolError(f"Failed to retrieve reports: {str(exc)}") from exc
@@ -332,7 +356,8 @@ def register_vm_workflow_tools(
             )
 
         try:
-            delta_response = gvm_client.get_report(
+            delta_response = await asyncio.to_thread(
+                gvm_client.get_report,
                 report_id=last_report_id,
                 delta_report_id=previous_report_id,
                 filter_string="levels=chml",